@@ -1,22 +1,10 @@
 from __future__ import annotations
-from typing import Optional
-from deepagents import create_deep_agent
-from langchain_core.runnables import Runnable
-from .llm import get_mc1_model
-from .memory import CairoMemoryTools
-from .tools.search import internet_search
-from .tools.recommendation import (
-    set_weights_tool,
-    boost_creator_tool,
-    demote_creator_tool,
-    block_tag_tool,
-    unblock_tag_tool,
-    search_content_tool,
-    trending_content_tool,
-    personalized_feed_tool,
-)
-from .policy import guard_tools
-from langchain.agents import DeepAgent  # <-- new import for explicit DeepAgent usage if needed
+import asyncio
+import functools
+import re
+from typing import Any, Optional
+from langchain_core.messages import SystemMessage
+from langchain_core.runnables import Runnable, RunnableLambda
 
 CAIRO_SYSTEM_INSTRUCTIONS = """
 You are CAIRO - ColomboAI In-App Reactive Operator - an in-app agent that is context-aware, privacy-respectful, and action-oriented.
@@ -39,27 +27,111 @@ General guidance:
 - For complex tasks, first write a short plan, then execute step-by-step.
 """
 
+# Used when a chit-chat prompt is answered without tools (see select_cairo_agent); it must not claim
+# tool access, or the model may report actions it never took.
+CAIRO_DIRECT_INSTRUCTIONS = """
+You are CAIRO - ColomboAI In-App Reactive Operator - an in-app agent that is context-aware, privacy-respectful, and action-oriented.
+You operate within the ColomboAI ecosystem (GenAI, Feed, CAIRO, News, Generative Shop).
+
+Mandatory restrictions (NON-NEGOTIABLE):
+- You MUST NOT like posts, auto-like, comment on posts, or auto-comment. Never take such actions or suggest them.
+- Do not publish externally without explicit confirmation.
+
+For this reply you have no tools:
+- You cannot change the recommendation engine, search or fetch content, browse the web, or read or write memory.
+- Never say or imply that you performed such an action. If the user wants one, say what you would do and ask them to confirm.
+
+General guidance:
+- Prefer concise, structured answers.
+"""
+
+# Only plain chit-chat skips the agent: greetings, thanks, acknowledgements and
+# farewells, matched against the whole user text. Anything else (questions, facts,
+# weather, news, recommendation requests) keeps its tools, including web search.
+_CHITCHAT_PHRASE = (
+    r"(?:hi|hello|hey|hiya|howdy|yo|good\s+(?:morning|afternoon|evening|night)|"
+    r"thanks|thank\s+you|thx|ty|cheers|ok|okay|cool|great|nice|awesome|got\s+it|"
+    r"bye|goodbye|see\s+(?:you|ya))"
+    r"(?:\s+(?:there|cairo|so\s+much|a\s+lot|again|everyone|all))?"
+)
+_CHITCHAT_RE = re.compile(
+    rf"\s*{_CHITCHAT_PHRASE}(?:[\s,.!]+{_CHITCHAT_PHRASE})*[\s,.!]*",
+    re.IGNORECASE,
+)
+
+_USER_ROLES = frozenset({"user", "human", "system"})
+
+def _role_and_text(message: Any) -> tuple[Optional[str], Any]:
+    if isinstance(message, dict):
+        return message.get("role") or message.get("type"), message.get("content")
+    if isinstance(message, (tuple, list)):
+        return (message[0] if message else None), (message[1] if len(message) > 1 else None)
+    return getattr(message, "type", None), getattr(message, "content", None)
+
+def _is_simple(inputs: Any) -> bool:
+    # Only an opening turn can skip the agent: once the assistant or a tool has
+    # spoken, a short reply like "yes, go ahead" may be confirming a pending action.
+    messages = inputs.get("messages") if isinstance(inputs, dict) else None
+    if not messages:
+        return False
+    user_texts = []
+    for message in messages:
+        role, content = _role_and_text(message)
+        if role not in _USER_ROLES:
+            return False
+        if role != "system":
+            if not isinstance(content, str):
+                return False
+            user_texts.append(content)
+    text = " ".join(user_texts)
+    return bool(text) and _CHITCHAT_RE.fullmatch(text) is not None
+
+def install_fast_loop(debug: Optional[bool] = None) -> asyncio.Runner:
+    # For the process entry point, e.g. `with install_fast_loop() as runner:
+    # runner.run(serve())`. The runner's loop is uvloop when installed (less per-await
+    # overhead for the async tool fan-out) and stock asyncio otherwise. Nothing global
+    # is changed, so it never affects a loop that is already running.
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.Runner(debug=debug)
+    return asyncio.Runner(debug=debug, loop_factory=uvloop.new_event_loop)
+
+def select_cairo_agent(inputs: Any, builtin_tools: Optional[list[str]] = None) -> Runnable:
+    # Route before invoking rather than wrapping the agent: chit-chat opening turns get
+    # a one-node LangGraph graph without tool schemas, everything else the full agent.
+    # Both are compiled graphs, so invoke/stream(stream_mode=...)/get_graph behave alike.
+    # builtin_tools (todos/files) were asked for explicitly, so they never bypass it.
+    if not builtin_tools and _is_simple(inputs):
+        return _build_direct_agent()
+    return build_cairo_agent(builtin_tools)
+
 def build_cairo_agent(builtin_tools: Optional[list[str]] = None) -> Runnable:
+    # The agent is stateless per request, so build it once per builtin_tools combination
+    return _build_cairo_agent(tuple(builtin_tools) if builtin_tools is not None else None)
+
+@functools.lru_cache(maxsize=8)
+def _build_cairo_agent(builtin_tools: Optional[tuple[str, ...]]) -> Runnable:
+    # Heavy imports are deferred so importing this module stays cheap on cold start
+    from deepagents import create_deep_agent
+    from .llm import get_mc1_model
+    from .memory import CairoMemoryTools
+    from .tools.search import internet_search
+    from .tools.recommendation import RECOMMENDATION_TOOLS
+    from .policy import guard_tools
+
     mem_tools = CairoMemoryTools()
     
-    tools = [
+    tools = (
         internet_search,        # SearxNG search
         mem_tools.add_tool,     # Mem0 write
         mem_tools.search_tool,  # Mem0 search
         mem_tools.get_all_tool, # Mem0 list
-        # Recommendation engine controls
-        set_weights_tool,
-        boost_creator_tool,
-        demote_creator_tool,
-        block_tag_tool,
-        unblock_tag_tool,
-        # Social media discovery tools
-        search_content_tool,
-        trending_content_tool,
-        personalized_feed_tool,
-    ]
+        # Recommendation engine controls + social media discovery tools
+        *RECOMMENDATION_TOOLS,
+    )
     
-    tools = guard_tools(tools)  # enforce policy: block like/comment actions
+    tools = guard_tools(list(tools))  # enforce policy: block like/comment actions
 
     model = get_mc1_model(temperature=0.2, max_tokens=2048)
 
@@ -68,14 +140,26 @@ def build_cairo_agent(builtin_tools: Optional[list[str]] = None) -> Runnable:
         tools=tools,
         instructions=CAIRO_SYSTEM_INSTRUCTIONS,
         model=model,
-        builtin_tools=builtin_tools,
-    )
-
-    # Optional: expose a direct DeepAgent instance if you want programmatic access
-    deep_agent_instance = DeepAgent(
-        tools=tools,
-        name="CAIRO_DeepAgent",
-        description="Context-aware in-app agent controlling recommendations and content discovery"
+        builtin_tools=list(builtin_tools) if builtin_tools is not None else None,
     )
 
     return agent
+
+@functools.lru_cache(maxsize=1)
+def _build_direct_agent() -> Runnable:
+    from langgraph.graph import END, START, MessagesState, StateGraph
+    from .llm import get_mc1_model
+
+    model = get_mc1_model(temperature=0.2, max_tokens=2048)
+
+    def respond(state: MessagesState) -> dict:
+        return {"messages": [model.invoke([SystemMessage(CAIRO_DIRECT_INSTRUCTIONS), *state["messages"]])]}
+
+    async def arespond(state: MessagesState) -> dict:
+        return {"messages": [await model.ainvoke([SystemMessage(CAIRO_DIRECT_INSTRUCTIONS), *state["messages"]])]}
+
+    graph = StateGraph(MessagesState)
+    graph.add_node("agent", RunnableLambda(respond, afunc=arespond))
+    graph.add_edge(START, "agent")
+    graph.add_edge("agent", END)
+    return graph.compile()
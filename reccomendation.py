@@ -1,21 +1,42 @@
 from __future__ import annotations
-from typing import Dict, Any
+import asyncio
+import atexit
+import functools
+import inspect
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Any, List, Literal
 import httpx
-from pydantic import BaseModel, Field
-from langchain_core.tools import StructuredTool
-from langchain.agents import DeepAgent  # <-- new import
+import orjson
+from cachetools import TTLCache
+from tenacity import retry, retry_if_exception, stop_after_attempt, stop_after_delay, wait_exponential_jitter
+from pydantic import BaseModel, ConfigDict, Field
 from ..config import settings
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # ==============================
 # Input Schemas
 # ==============================
 
+# Tool args are validated on every call; frozen + extra="forbid" keeps that on
+# pydantic-core's fast path and rejects hallucinated fields.
+_INPUT_CONFIG = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
 class SetWeightsInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
     weights: Dict[str, float] = Field(
         description="Feature weights, e.g. {'freshness':0.4,'similarity':0.3,'novelty':0.3}"
     )
 
 class BoostCreatorInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
     creator_id: str = Field(description="Creator/user ID to boost")
     factor: float = Field(
         ge=0.0, le=10.0,
@@ -23,6 +44,8 @@ class BoostCreatorInput(BaseModel):
     )
 
 class DemoteCreatorInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
     creator_id: str = Field(description="Creator/user ID to demote")
     factor: float = Field(
         ge=0.0, le=10.0,
@@ -30,146 +53,743 @@ class DemoteCreatorInput(BaseModel):
     )
 
 class BlockTagInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
     tag: str = Field(description="Content tag/category to block")
 
 class UnblockTagInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
     tag: str = Field(description="Content tag/category to unblock")
 
 # ---- Content Inputs ----
 class SearchContentInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
     query: str = Field(description="Search query string (keywords, hashtags, etc.)")
     limit: int = Field(default=10, description="Maximum number of results to return")
 
+class SearchContentBatchInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
+    queries: List[str] = Field(description="Search query strings to run together")
+    limit: int = Field(default=10, description="Maximum number of results to return per query")
+
 # ---- Social Media Discovery Inputs ----
 class TrendingContentInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
     category: str = Field(default="all", description="Category to fetch trending content from")
     limit: int = Field(default=10, description="Maximum number of trending posts to return")
 
 class PersonalizedFeedInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
     user_id: str = Field(description="User ID for whom to generate the feed")
     limit: int = Field(default=10, description="Maximum number of posts to return")
 
+# ---- Bulk Control Inputs ----
+class ControlOp(BaseModel):
+    model_config = _INPUT_CONFIG
+
+    op: Literal[
+        "set_recommendation_weights", "boost_creator", "demote_creator", "block_tag", "unblock_tag"
+    ] = Field(description="Control operation to run")
+    args: Dict[str, Any] = Field(
+        description=(
+            "Arguments for the operation, validated against that op's own tool input, "
+            "e.g. {'creator_id':'u1','factor':1.5}"
+        )
+    )
+
+class BulkControlInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
+    ops: List[ControlOp] = Field(description="Control operations to apply in a single call")
+
+# ---- Multi-target Control Inputs ----
+class BoostCreatorsInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
+    creators: List[BoostCreatorInput] = Field(description="Creators to boost, each with its own factor")
+
+class DemoteCreatorsInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
+    creators: List[DemoteCreatorInput] = Field(description="Creators to demote, each with its own factor")
+
+class BlockTagsInput(BaseModel):
+    model_config = _INPUT_CONFIG
+
+    tags: List[str] = Field(description="Content tags/categories to block")
+
 # ==============================
-# Internal POST helper
+# Shared HTTP client + POST helper
 # ==============================
 
-def _post(path: str, payload: Dict[str, Any]) -> Any:
-    base = settings.rec_engine_url.rstrip("/")
-    headers = {}
-    if settings.rec_api_key:
-        headers["Authorization"] = f"Bearer {settings.rec_api_key}"
-    with httpx.Client(timeout=30) as client:
-        r = client.post(f"{base}{path}", json=payload, headers=headers)
+_BASE_URL = settings.rec_engine_url.rstrip("/")
+_HEADERS = {"Authorization": f"Bearer {settings.rec_api_key}"} if settings.rec_api_key else {}
+
+# Auth and base URL are bound on the clients so each call only passes path + body
+_MAX_KEEPALIVE = 100
+_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=_MAX_KEEPALIVE)
+
+# Per-attempt timeout; retries are also capped by a total deadline (see _STOP), so a
+# hung engine costs one tool call about as long as the old single 30s attempt did.
+_ATTEMPT_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+# HTTP/2 multiplexes concurrent tool calls over one connection; needs `httpx[http2]`.
+# Without `h2` installed we stay on HTTP/1.1 keep-alive.
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+_CLIENT = httpx.Client(
+    base_url=_BASE_URL,
+    headers=_HEADERS,
+    timeout=_ATTEMPT_TIMEOUT,
+    http2=_HTTP2,
+    limits=_LIMITS,
+)
+atexit.register(_CLIENT.close)
+
+# Async twin used by the tools' `coroutine=` path so parallel tool calls overlap.
+# AsyncClient connections and asyncio.Semaphore waiters belong to the loop that
+# created them, so each running loop gets its own client + semaphore. Hosts that
+# start a fresh loop per invocation (e.g. `asyncio.run` per request) should
+# `await aclose_async_client()` before that loop ends.
+_ACLIENTS: Dict[asyncio.AbstractEventLoop, tuple[httpx.AsyncClient, asyncio.Semaphore]] = {}
+_ACLIENTS_LOCK = threading.Lock()
+
+def _aclient() -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    loop = asyncio.get_running_loop()
+    with _ACLIENTS_LOCK:
+        state = _ACLIENTS.get(loop)
+        if state is None:
+            # Drop clients left behind by loops that were closed without the hook
+            for stale in [l for l in _ACLIENTS if l.is_closed()]:
+                del _ACLIENTS[stale]
+            client = httpx.AsyncClient(
+                base_url=_BASE_URL,
+                headers=_HEADERS,
+                timeout=_ATTEMPT_TIMEOUT,
+                http2=_HTTP2,
+                limits=_LIMITS,
+            )
+            # Bounds in-flight requests to the keep-alive pool so large fan-outs
+            # queue here instead of opening extra connections to the rec engine.
+            state = _ACLIENTS[loop] = (client, asyncio.Semaphore(_MAX_KEEPALIVE))
+    return state
+
+async def aclose_async_client() -> None:
+    with _ACLIENTS_LOCK:
+        state = _ACLIENTS.pop(asyncio.get_running_loop(), None)
+    if state is not None:
+        await state[0].aclose()
+
+# ---- Retries + circuit breaker ----
+class RecEngineUnavailable(RuntimeError):
+    """Raised without touching the network while the circuit breaker is open."""
+
+class _CircuitBreaker:
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    def check(self) -> None:
+        with self._lock:
+            if self._opened_at is not None and time.monotonic() - self._opened_at < self.cooldown:
+                raise RecEngineUnavailable("Recommendation engine unavailable; retry later")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+_BREAKER = _CircuitBreaker(threshold=5, cooldown=30.0)
+
+def _is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code >= 500
+
+def _is_unsent(exc: BaseException) -> bool:
+    # The request never reached the engine, so re-sending cannot apply it twice
+    return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+# Every attempt goes through the breaker: it is checked before each try (an open
+# breaker raises RecEngineUnavailable, which is not retried) and each transient
+# failure counts toward opening it.
+def _attempt(path: str, payload: Dict[str, Any]) -> httpx.Response:
+    _BREAKER.check()
+    try:
+        r = _CLIENT.post(path, json=payload).raise_for_status()
+    except Exception as exc:
+        if _is_transient(exc):
+            _BREAKER.record_failure()
+        raise
+    _BREAKER.record_success()
+    return r
+
+async def _aattempt(path: str, payload: Dict[str, Any]) -> httpx.Response:
+    _BREAKER.check()
+    client, semaphore = _aclient()
+    try:
+        async with semaphore:
+            r = await client.post(path, json=payload)
         r.raise_for_status()
-        return r.json()
+    except Exception as exc:
+        if _is_transient(exc):
+            _BREAKER.record_failure()
+        raise
+    _BREAKER.record_success()
+    return r
+
+_STOP = stop_after_attempt(4) | stop_after_delay(30)
+_WAIT = wait_exponential_jitter(initial=0.1, max=2.0)
+
+# Read endpoints are safe to repeat, so any transient failure is retried. Control
+# POSTs are not idempotent (a read timeout may hit after the engine applied the
+# change), so they are only retried when the request was never sent.
+_retry_read = retry(stop=_STOP, wait=_WAIT, retry=retry_if_exception(_is_transient), reraise=True)
+_retry_control = retry(stop=_STOP, wait=_WAIT, retry=retry_if_exception(_is_unsent), reraise=True)
+
+_send_read = _retry_read(_attempt)
+_send_control = _retry_control(_attempt)
+_asend_read = _retry_read(_aattempt)
+_asend_control = _retry_control(_aattempt)
+
+# Control endpoints only ack, so their body is never decoded and the caller gets a
+# constant ack (same shape as the multi-op outcomes); content endpoints can return
+# large feeds and go through orjson.
+def _post_ack(path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    _send_control(path, payload)
+    return {"ok": True}
+
+def _post_json(path: str, payload: Dict[str, Any]) -> Any:
+    return orjson.loads(_send_read(path, payload).content)
+
+async def _apost_ack(path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    await _asend_control(path, payload)
+    return {"ok": True}
+
+async def _apost_json(path: str, payload: Dict[str, Any]) -> Any:
+    return orjson.loads((await _asend_read(path, payload)).content)
+
+# ==============================
+# Read cache
+# ==============================
+
+# Idempotent read endpoints are memoized briefly; any control op clears the cache
+# since it can change what search/trending return. Entries are stored as JSON bytes
+# so every hit hands the caller its own copy. The generation counter stops a read
+# that overlapped a control op from writing pre-change data back after the clear.
+_READ_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_READ_CACHE_LOCK = threading.Lock()
+_READ_GENERATION = 0
+
+def _cache_lookup(key: Any) -> tuple[bool, Any, int]:
+    with _READ_CACHE_LOCK:
+        cached = _READ_CACHE.get(key)
+        generation = _READ_GENERATION
+    if cached is None:
+        return False, None, generation
+    return True, orjson.loads(cached), generation
+
+def _cache_store(key: Any, result: Any, generation: int) -> None:
+    data = orjson.dumps(result)
+    with _READ_CACHE_LOCK:
+        if generation == _READ_GENERATION:
+            _READ_CACHE[key] = data
+
+def _invalidate_reads() -> None:
+    global _READ_GENERATION
+    with _READ_CACHE_LOCK:
+        _READ_GENERATION += 1
+        _READ_CACHE.clear()
+
+def _cached_read(name: str):
+    def decorator(fn):
+        sig = inspect.signature(fn)
+
+        def key_for(args, kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return (name, tuple(bound.arguments.items()))
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                key = key_for(args, kwargs)
+                hit, result, generation = _cache_lookup(key)
+                if hit:
+                    return result
+                result = await fn(*args, **kwargs)
+                _cache_store(key, result, generation)
+                return result
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = key_for(args, kwargs)
+            hit, result, generation = _cache_lookup(key)
+            if hit:
+                return result
+            result = fn(*args, **kwargs)
+            _cache_store(key, result, generation)
+            return result
+        return wrapper
+    return decorator
+
+def _invalidates_reads(fn):
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                _invalidate_reads()
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _invalidate_reads()
+    return wrapper
 
 # ==============================
 # Control Functions
 # ==============================
 
-def set_recommendation_weights(weights: Dict[str, float]) -> Any:
-    return _post("/api/control/set_weights", {"weights": weights})
+@_invalidates_reads
+def set_recommendation_weights(weights: Dict[str, float]) -> Dict[str, Any]:
+    return _post_ack("/api/control/set_weights", {"weights": weights})
 
-def boost_creator(creator_id: str, factor: float) -> Any:
-    return _post("/api/control/boost_creator", {"creator_id": creator_id, "factor": factor})
+@_invalidates_reads
+def boost_creator(creator_id: str, factor: float) -> Dict[str, Any]:
+    return _post_ack("/api/control/boost_creator", {"creator_id": creator_id, "factor": factor})
 
-def demote_creator(creator_id: str, factor: float) -> Any:
-    return _post("/api/control/demote_creator", {"creator_id": creator_id, "factor": factor})
+@_invalidates_reads
+def demote_creator(creator_id: str, factor: float) -> Dict[str, Any]:
+    return _post_ack("/api/control/demote_creator", {"creator_id": creator_id, "factor": factor})
 
-def block_tag(tag: str) -> Any:
-    return _post("/api/control/block_tag", {"tag": tag})
+@_invalidates_reads
+def block_tag(tag: str) -> Dict[str, Any]:
+    return _post_ack("/api/control/block_tag", {"tag": tag})
 
-def unblock_tag(tag: str) -> Any:
-    return _post("/api/control/unblock_tag", {"tag": tag})
+@_invalidates_reads
+def unblock_tag(tag: str) -> Dict[str, Any]:
+    return _post_ack("/api/control/unblock_tag", {"tag": tag})
 
 # ---- Content Discovery Functions ----
+@_cached_read("search_content")
 def search_content(query: str, limit: int = 10) -> Any:
-    return _post("/api/search/content", {"query": query, "limit": limit})
+    return _post_json("/api/search/content", {"query": query, "limit": limit})
 
+@_cached_read("trending_content")
 def trending_content(category: str = "all", limit: int = 10) -> Any:
-    return _post("/api/content/trending", {"category": category, "limit": limit})
+    return _post_json("/api/content/trending", {"category": category, "limit": limit})
 
 def personalized_feed(user_id: str, limit: int = 10) -> Any:
-    return _post("/api/content/personalized_feed", {"user_id": user_id, "limit": limit})
+    return _post_json("/api/content/personalized_feed", {"user_id": user_id, "limit": limit})
 
 # ==============================
-# Structured Tools
+# Async Control Functions
 # ==============================
 
-# Recommendation control tools
-set_weights_tool = StructuredTool(
-    name="set_recommendation_weights",
-    description="Control the recommendation engine feature weights",
-    func=set_recommendation_weights,
-    args_schema=SetWeightsInput,
-)
+@_invalidates_reads
+async def aset_recommendation_weights(weights: Dict[str, float]) -> Dict[str, Any]:
+    return await _apost_ack("/api/control/set_weights", {"weights": weights})
 
-boost_creator_tool = StructuredTool(
-    name="boost_creator",
-    description="Temporarily boost a creator's content in recommendations",
-    func=boost_creator,
-    args_schema=BoostCreatorInput,
-)
+@_invalidates_reads
+async def aboost_creator(creator_id: str, factor: float) -> Dict[str, Any]:
+    return await _apost_ack("/api/control/boost_creator", {"creator_id": creator_id, "factor": factor})
 
-demote_creator_tool = StructuredTool(
-    name="demote_creator",
-    description="Temporarily demote a creator's content in recommendations",
-    func=demote_creator,
-    args_schema=DemoteCreatorInput,
-)
+@_invalidates_reads
+async def ademote_creator(creator_id: str, factor: float) -> Dict[str, Any]:
+    return await _apost_ack("/api/control/demote_creator", {"creator_id": creator_id, "factor": factor})
 
-block_tag_tool = StructuredTool(
-    name="block_tag",
-    description="Block a content tag/category from recommendations",
-    func=block_tag,
-    args_schema=BlockTagInput,
-)
+@_invalidates_reads
+async def ablock_tag(tag: str) -> Dict[str, Any]:
+    return await _apost_ack("/api/control/block_tag", {"tag": tag})
 
-unblock_tag_tool = StructuredTool(
-    name="unblock_tag",
-    description="Unblock a content tag/category in recommendations",
-    func=unblock_tag,
-    args_schema=UnblockTagInput,
-)
+@_invalidates_reads
+async def aunblock_tag(tag: str) -> Dict[str, Any]:
+    return await _apost_ack("/api/control/unblock_tag", {"tag": tag})
 
-# Content discovery tools
-search_content_tool = StructuredTool(
-    name="search_content",
-    description="Search content by keywords or hashtags",
-    func=search_content,
-    args_schema=SearchContentInput,
-)
+# ---- Async Content Discovery Functions ----
+@_cached_read("search_content")
+async def asearch_content(query: str, limit: int = 10) -> Any:
+    return await _apost_json("/api/search/content", {"query": query, "limit": limit})
 
-trending_content_tool = StructuredTool(
-    name="trending_content",
-    description="Fetch top trending posts for a category",
-    func=trending_content,
-    args_schema=TrendingContentInput,
-)
+@_cached_read("trending_content")
+async def atrending_content(category: str = "all", limit: int = 10) -> Any:
+    return await _apost_json("/api/content/trending", {"category": category, "limit": limit})
 
-personalized_feed_tool = StructuredTool(
-    name="personalized_feed",
-    description="Generate a personalized feed for a specific user based on engagement history",
-    func=personalized_feed,
-    args_schema=PersonalizedFeedInput,
-)
+async def apersonalized_feed(user_id: str, limit: int = 10) -> Any:
+    return await _apost_json("/api/content/personalized_feed", {"user_id": user_id, "limit": limit})
+
+# ---- Batched Search ----
+# Runs several queries in one tool call; each query goes through the read cache.
+def search_content_batch(queries: List[str], limit: int = 10) -> Dict[str, Any]:
+    return {q: search_content(q, limit) for q in queries}
+
+async def asearch_content_batch(queries: List[str], limit: int = 10) -> Dict[str, Any]:
+    results = await asyncio.gather(*[asearch_content(q, limit) for q in queries])
+    return dict(zip(queries, results))
+
+# ==============================
+# Columnar Feed View
+# ==============================
+
+# Tools hand posts to the LLM as dicts; code that ranks or filters feeds in Python
+# should use this column layout instead of looping over dict lookups per post.
+# numpy is imported inside the methods so the tools' import path never pays for it.
+#
+# Posts are read from a bare list or {"posts": [...]}. `created_at` may be epoch
+# seconds, epoch milliseconds (normalised to seconds) or an ISO-8601 string (naive
+# values are taken as UTC); missing or unparseable values become 0.
+_EPOCH_MS_THRESHOLD = 100_000_000_000  # larger values are milliseconds (year 5138+ in seconds)
+
+def _epoch_seconds(value: Any) -> int:
+    if value is None or value == "":
+        return 0
+    try:
+        if isinstance(value, str):
+            try:
+                seconds = float(value)
+            except ValueError:
+                dt = datetime.fromisoformat(value)
+                if dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=timezone.utc)
+                return int(dt.timestamp())
+        else:
+            seconds = float(value)
+    except (TypeError, ValueError, OverflowError):
+        return 0
+    if not math.isfinite(seconds):
+        return 0
+    if abs(seconds) >= _EPOCH_MS_THRESHOLD:
+        seconds /= 1000
+    return int(seconds)
+
+@dataclass(frozen=True, slots=True)
+class FeedSoA:
+    ids: np.ndarray         # object
+    scores: np.ndarray      # float32
+    created_at: np.ndarray  # int64, epoch seconds
+    tags: List[List[str]]
+    posts: List[Dict[str, Any]]
+
+    @classmethod
+    def from_response(cls, payload: Any) -> "FeedSoA":
+        import numpy as np
+
+        posts = payload.get("posts", []) if isinstance(payload, dict) else list(payload)
+        n = len(posts)
+        return cls(
+            ids=np.fromiter((p.get("id") for p in posts), dtype=object, count=n),
+            scores=np.fromiter((p.get("score") or 0.0 for p in posts), dtype=np.float32, count=n),
+            created_at=np.fromiter((_epoch_seconds(p.get("created_at")) for p in posts), dtype=np.int64, count=n),
+            tags=[p.get("tags") or [] for p in posts],
+            posts=posts,
+        )
+
+    def __len__(self) -> int:
+        return len(self.posts)
+
+    def as_dicts(self) -> List[Dict[str, Any]]:
+        return self.posts
+
+    def take(self, index: np.ndarray) -> "FeedSoA":
+        import numpy as np
+
+        rows = np.arange(len(self))[index]
+        return FeedSoA(
+            ids=self.ids[rows],
+            scores=self.scores[rows],
+            created_at=self.created_at[rows],
+            tags=[self.tags[i] for i in rows],
+            posts=[self.posts[i] for i in rows],
+        )
+
+    def without_tags(self, blocked: List[str]) -> "FeedSoA":
+        import numpy as np
+
+        counts = np.fromiter((len(t) for t in self.tags), dtype=np.intp, count=len(self))
+        owners = np.repeat(np.arange(len(self)), counts)
+        flat = np.array([tag for t in self.tags for tag in t], dtype=object)
+        keep = np.ones(len(self), dtype=bool)
+        keep[owners[np.isin(flat, blocked)]] = False
+        return self.take(keep)
+
+    def top(self, k: int) -> "FeedSoA":
+        import numpy as np
+
+        return self.take(np.argsort(-self.scores, kind="stable")[:k])
+
+def trending_content_soa(category: str = "all", limit: int = 10) -> FeedSoA:
+    return FeedSoA.from_response(trending_content(category, limit))
+
+def personalized_feed_soa(user_id: str, limit: int = 10) -> FeedSoA:
+    return FeedSoA.from_response(personalized_feed(user_id, limit))
+
+async def atrending_content_soa(category: str = "all", limit: int = 10) -> FeedSoA:
+    return FeedSoA.from_response(await atrending_content(category, limit))
+
+async def apersonalized_feed_soa(user_id: str, limit: int = 10) -> FeedSoA:
+    return FeedSoA.from_response(await apersonalized_feed(user_id, limit))
+
+# ==============================
+# Fan-out Outcomes
+# ==============================
+
+# Multi-op tools report each op separately so the agent can say exactly what
+# changed when only some of them succeed.
+def _outcome(label: Dict[str, Any], error: BaseException | None = None) -> Dict[str, Any]:
+    if error is None:
+        return {**label, "ok": True}
+    return {**label, "ok": False, "error": f"{type(error).__name__}: {error}"}
+
+def _apply_each(calls: List[tuple[Dict[str, Any], Callable[[], Any]]]) -> List[Dict[str, Any]]:
+    results = []
+    for label, call in calls:
+        try:
+            call()
+        except Exception as exc:
+            results.append(_outcome(label, exc))
+        else:
+            results.append(_outcome(label))
+    return results
+
+async def _aapply_each(calls: List[tuple[Dict[str, Any], Awaitable[Any]]]) -> List[Dict[str, Any]]:
+    settled = await asyncio.gather(*[aw for _, aw in calls], return_exceptions=True)
+    results = []
+    for (label, _), result in zip(calls, settled):
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+        results.append(_outcome(label, result if isinstance(result, Exception) else None))
+    return results
+
+# ==============================
+# Multi-target Control
+# ==============================
+
+def boost_creators(creators: List[BoostCreatorInput]) -> List[Dict[str, Any]]:
+    creators = [BoostCreatorInput.model_validate(c) for c in creators]
+    return _apply_each([
+        (c.model_dump(), functools.partial(boost_creator, c.creator_id, c.factor)) for c in creators
+    ])
+
+async def aboost_creators(creators: List[BoostCreatorInput]) -> List[Dict[str, Any]]:
+    creators = [BoostCreatorInput.model_validate(c) for c in creators]
+    return await _aapply_each([
+        (c.model_dump(), aboost_creator(c.creator_id, c.factor)) for c in creators
+    ])
+
+def demote_creators(creators: List[DemoteCreatorInput]) -> List[Dict[str, Any]]:
+    creators = [DemoteCreatorInput.model_validate(c) for c in creators]
+    return _apply_each([
+        (c.model_dump(), functools.partial(demote_creator, c.creator_id, c.factor)) for c in creators
+    ])
+
+async def ademote_creators(creators: List[DemoteCreatorInput]) -> List[Dict[str, Any]]:
+    creators = [DemoteCreatorInput.model_validate(c) for c in creators]
+    return await _aapply_each([
+        (c.model_dump(), ademote_creator(c.creator_id, c.factor)) for c in creators
+    ])
+
+def block_tags(tags: List[str]) -> List[Dict[str, Any]]:
+    return _apply_each([({"tag": t}, functools.partial(block_tag, t)) for t in tags])
+
+async def ablock_tags(tags: List[str]) -> List[Dict[str, Any]]:
+    return await _aapply_each([({"tag": t}, ablock_tag(t)) for t in tags])
 
 # ==============================
-# DeepAgent Setup
+# Bulk Control
 # ==============================
 
-# Create a DeepAgent with all structured tools
-deep_agent = DeepAgent(
-    tools=[
-        set_weights_tool,
-        boost_creator_tool,
-        demote_creator_tool,
-        block_tag_tool,
-        unblock_tag_tool,
-        search_content_tool,
-        trending_content_tool,
-        personalized_feed_tool,
-    ],
-    name="RecommendationAgent",
-    description="Agent to control recommendations and discover content"
+_CONTROL_INPUTS: Dict[str, type[BaseModel]] = {
+    "set_recommendation_weights": SetWeightsInput,
+    "boost_creator": BoostCreatorInput,
+    "demote_creator": DemoteCreatorInput,
+    "block_tag": BlockTagInput,
+    "unblock_tag": UnblockTagInput,
+}
+
+_CONTROL_OPS = {
+    "set_recommendation_weights": set_recommendation_weights,
+    "boost_creator": boost_creator,
+    "demote_creator": demote_creator,
+    "block_tag": block_tag,
+    "unblock_tag": unblock_tag,
+}
+
+_ACONTROL_OPS = {
+    "set_recommendation_weights": aset_recommendation_weights,
+    "boost_creator": aboost_creator,
+    "demote_creator": ademote_creator,
+    "block_tag": ablock_tag,
+    "unblock_tag": aunblock_tag,
+}
+
+# Every op is validated against its own input model before any is sent, so a bad
+# op rejects the whole batch instead of leaving it half-applied.
+def _parse_ops(ops: List[ControlOp]) -> List[tuple[str, Dict[str, Any]]]:
+    parsed = []
+    for o in ops:
+        o = ControlOp.model_validate(o)
+        args = _CONTROL_INPUTS[o.op].model_validate(o.args).model_dump()
+        parsed.append((o.op, args))
+    return parsed
+
+def bulk_control(ops: List[ControlOp]) -> List[Dict[str, Any]]:
+    return _apply_each([
+        ({"op": op, "args": args}, functools.partial(_CONTROL_OPS[op], **args))
+        for op, args in _parse_ops(ops)
+    ])
+
+async def abulk_control(ops: List[ControlOp]) -> List[Dict[str, Any]]:
+    return await _aapply_each([
+        ({"op": op, "args": args}, _ACONTROL_OPS[op](**args))
+        for op, args in _parse_ops(ops)
+    ])
+
+# ==============================
+# Structured Tools
+# ==============================
+
+# One entry per public tool attribute: (module attribute name, StructuredTool kwargs).
+# Both the builder and __getattr__ read this, so the tool set is defined once.
+_TOOL_SPECS: tuple = (
+    # Recommendation control tools
+    ("set_weights_tool", dict(
+        name="set_recommendation_weights",
+        description="Control the recommendation engine feature weights",
+        func=set_recommendation_weights,
+        coroutine=aset_recommendation_weights,
+        args_schema=SetWeightsInput,
+    )),
+    ("boost_creator_tool", dict(
+        name="boost_creator",
+        description="Temporarily boost a creator's content in recommendations",
+        func=boost_creator,
+        coroutine=aboost_creator,
+        args_schema=BoostCreatorInput,
+    )),
+    ("demote_creator_tool", dict(
+        name="demote_creator",
+        description="Temporarily demote a creator's content in recommendations",
+        func=demote_creator,
+        coroutine=ademote_creator,
+        args_schema=DemoteCreatorInput,
+    )),
+    ("block_tag_tool", dict(
+        name="block_tag",
+        description="Block a content tag/category from recommendations",
+        func=block_tag,
+        coroutine=ablock_tag,
+        args_schema=BlockTagInput,
+    )),
+    ("unblock_tag_tool", dict(
+        name="unblock_tag",
+        description="Unblock a content tag/category in recommendations",
+        func=unblock_tag,
+        coroutine=aunblock_tag,
+        args_schema=UnblockTagInput,
+    )),
+    ("boost_creators_tool", dict(
+        name="boost_creators",
+        description="Boost several creators at once; prefer this over repeated boost_creator calls",
+        func=boost_creators,
+        coroutine=aboost_creators,
+        args_schema=BoostCreatorsInput,
+    )),
+    ("demote_creators_tool", dict(
+        name="demote_creators",
+        description="Demote several creators at once; prefer this over repeated demote_creator calls",
+        func=demote_creators,
+        coroutine=ademote_creators,
+        args_schema=DemoteCreatorsInput,
+    )),
+    ("block_tags_tool", dict(
+        name="block_tags",
+        description="Block several content tags/categories at once; prefer this over repeated block_tag calls",
+        func=block_tags,
+        coroutine=ablock_tags,
+        args_schema=BlockTagsInput,
+    )),
+    ("bulk_control_tool", dict(
+        name="bulk_control",
+        description=(
+            "Apply several recommendation control operations (weights, boost/demote creator, "
+            "block/unblock tag) in one call; prefer this over repeated single-op tools"
+        ),
+        func=bulk_control,
+        coroutine=abulk_control,
+        args_schema=BulkControlInput,
+    )),
+
+    # Content discovery tools
+    ("search_content_tool", dict(
+        name="search_content",
+        description="Search content by keywords or hashtags; use search_content_batch for 2+ queries",
+        func=search_content,
+        coroutine=asearch_content,
+        args_schema=SearchContentInput,
+    )),
+    ("search_content_batch_tool", dict(
+        name="search_content_batch",
+        description="Search content for several queries in one call; prefer this over repeated search_content calls",
+        func=search_content_batch,
+        coroutine=asearch_content_batch,
+        args_schema=SearchContentBatchInput,
+    )),
+    ("trending_content_tool", dict(
+        name="trending_content",
+        description="Fetch top trending posts for a category",
+        func=trending_content,
+        coroutine=atrending_content,
+        args_schema=TrendingContentInput,
+    )),
+    ("personalized_feed_tool", dict(
+        name="personalized_feed",
+        description="Generate a personalized feed for a specific user based on engagement history",
+        func=personalized_feed,
+        coroutine=apersonalized_feed,
+        args_schema=PersonalizedFeedInput,
+    )),
 )
+_TOOL_NAMES = frozenset(attr for attr, _ in _TOOL_SPECS)
+
+# LangChain is only imported once a tool is first requested (see __getattr__),
+# so importing this module for its plain functions stays cheap.
+@functools.lru_cache(maxsize=None)
+def _build_tools() -> Dict[str, Any]:
+    from langchain_core.tools import StructuredTool
+
+    return {attr: StructuredTool(**spec) for attr, spec in _TOOL_SPECS}
+
+def __getattr__(name: str) -> Any:
+    if name in _TOOL_NAMES:
+        value = _build_tools()[name]
+    elif name == "RECOMMENDATION_TOOLS":
+        # Single shared, immutable tool set for every agent that needs these tools
+        value = tuple(_build_tools().values())
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
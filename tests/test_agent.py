@@ -0,0 +1,75 @@
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("langgraph")
+from langchain_core.language_models import FakeListChatModel
+
+ROOT = Path(__file__).resolve().parent.parent
+PKG = "_cairo_under_test"
+REPLY = "Hello! How can I help?"
+
+
+@pytest.fixture
+def agent_module(monkeypatch):
+    # agent.py lives inside the app package and imports its siblings relatively;
+    # load it under a throwaway package with only the model factory stubbed.
+    pkg = types.ModuleType(PKG)
+    pkg.__path__ = [str(ROOT)]
+    llm = types.ModuleType(f"{PKG}.llm")
+    llm.get_mc1_model = lambda **_: FakeListChatModel(responses=[REPLY])
+    monkeypatch.setitem(sys.modules, PKG, pkg)
+    monkeypatch.setitem(sys.modules, f"{PKG}.llm", llm)
+
+    spec = importlib.util.spec_from_file_location(f"{PKG}.agent", ROOT / "agent.py")
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _user(text):
+    return {"messages": [{"role": "user", "content": text}]}
+
+
+def test_chitchat_streams_like_a_graph(agent_module):
+    inputs = _user("hello")
+    runnable = agent_module.select_cairo_agent(inputs)
+
+    values = list(runnable.stream(inputs, stream_mode="values"))
+    assert values[0]["messages"][-1].content == "hello"
+    assert values[-1]["messages"][-1].content == REPLY
+
+    updates = list(runnable.stream(inputs, stream_mode="updates"))
+    assert [list(chunk) for chunk in updates] == [["agent"]]
+    assert updates[0]["agent"]["messages"][-1].content == REPLY
+
+    assert "agent" in runnable.get_graph().nodes
+
+
+@pytest.mark.parametrize(
+    "inputs, builtin_tools",
+    [
+        (_user("what's the weather in Colombo?"), None),
+        (_user("Who won the election yesterday?"), None),
+        (_user("boost creator u1"), None),
+        (_user("hello"), ["todos"]),
+        (
+            {
+                "messages": [
+                    {"role": "user", "content": "hi"},
+                    {"role": "assistant", "content": "Shall I boost creator X?"},
+                    {"role": "user", "content": "yes, go ahead"},
+                ]
+            },
+            None,
+        ),
+    ],
+)
+def test_everything_else_uses_the_full_agent(agent_module, monkeypatch, inputs, builtin_tools):
+    full_agent = object()
+    monkeypatch.setattr(agent_module, "build_cairo_agent", lambda builtin_tools=None: full_agent)
+    assert agent_module.select_cairo_agent(inputs, builtin_tools) is full_agent